@@ -14,22 +14,32 @@ Attack Scenarios:
 """
 
 import asyncio
+import bisect
 import hashlib
-import json
+import io
 import random
+import struct
+import sys
 import time
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Optional, TextIO
 import aiohttp
 import argparse
 
 
-@dataclass
+# Report separators, built once and shared by every simulation
+SEPARATOR = "=" * 70
+REORG_BANNER = "!" * 70
+SUITE_BANNER = "#" * 70
+
+
+@dataclass(slots=True)
 class Block:
     """Blockchain block structure"""
     height: int
-    hash: str
-    prev_hash: str
+    hash: bytes  # Raw 32-byte SHA-256 digest
+    prev_hash: bytes
     timestamp: int
     difficulty: int
     nonce: int
@@ -46,33 +56,47 @@ class SimulationConfig:
     attack_type: str
     network_delay: float  # Network propagation delay in seconds
     verbose: bool
+    seed: Optional[int]  # RNG seed for reproducible runs (None = unseeded)
+    realtime: bool  # Sleep for simulated mining time instead of logical rounds
 
 
 class MiningSimulator:
     """Simulates PoW mining"""
     
-    def __init__(self, hashrate: float, miner_id: str):
+    # Binary block header: height, prev_hash, timestamp, nonce
+    HEADER = struct.Struct("<Q32sQI")
+    
+    def __init__(self, hashrate: float, miner_id: str, rng: random.Random,
+                 realtime: bool = False):
         self.hashrate = hashrate  # Blocks per minute
         self.miner_id = miner_id
+        self.rng = rng
+        self.realtime = realtime
+        # Reused header buffer, packed in place for every block
+        self._header = bytearray(self.HEADER.size)
         
-    def mine_block(self, height: int, prev_hash: str, difficulty: int) -> Block:
+    def mine_block(self, height: int, prev_hash: bytes, difficulty: int) -> Block:
         """
         Simulate mining a block (simplified PoW)
         In reality, this would involve SHA-256 hashing until target met.
         """
-        # Simulate mining time based on hashrate
-        time_to_mine = random.expovariate(self.hashrate / 60)  # Convert to per-second
-        time.sleep(min(time_to_mine, 0.1))  # Cap at 100ms for simulation speed
-        
-        nonce = random.randint(0, 2**32)
-        block_data = f"{height}{prev_hash}{int(time.time())}{nonce}".encode()
-        block_hash = hashlib.sha256(block_data).hexdigest()
+        # Rounds are logical: who finds the block is decided by the caller's
+        # hashrate draw, so wall-clock mining delay is only simulated on request
+        if self.realtime:
+            time_to_mine = self.rng.expovariate(self.hashrate / 60)  # Convert to per-second
+            time.sleep(min(time_to_mine, 0.1))  # Cap at 100ms for simulation speed
+        
+        nonce = self.rng.getrandbits(32)
+        # Read the clock once so the hashed and stored timestamps match
+        now = int(time.time())
+        self.HEADER.pack_into(self._header, 0, height, prev_hash, now, nonce)
+        block_hash = hashlib.sha256(self._header).digest()
         
         return Block(
             height=height,
             hash=block_hash,
             prev_hash=prev_hash,
-            timestamp=int(time.time()),
+            timestamp=now,
             difficulty=difficulty,
             nonce=nonce,
             transactions=[],
@@ -83,218 +107,285 @@ class MiningSimulator:
 class SelfishMiningAttack:
     """Implements selfish mining strategy"""
     
-    def __init__(self, config: SimulationConfig):
+    # Per-round messages are buffered and written out every this many rounds
+    LOG_FLUSH_ROUNDS = 1024
+    
+    def __init__(self, config: SimulationConfig, out: Optional[TextIO] = None):
         self.config = config
-        self.attacker_miner = MiningSimulator(config.attacker_hashrate, "ATTACKER")
+        self.out = out if out is not None else sys.stdout
+        # One RNG instance per simulation, shared by all of its miners
+        self.rng = random.Random(config.seed)
+        self.attacker_miner = MiningSimulator(
+            config.attacker_hashrate, "ATTACKER", self.rng, config.realtime
+        )
         self.honest_miners = [
-            MiningSimulator(config.honest_hashrate / 3, f"HONEST_{i}")
+            MiningSimulator(config.honest_hashrate / 3, f"HONEST_{i}", self.rng, config.realtime)
             for i in range(3)
         ]
         
-        # Blockchain states
-        self.public_chain: List[Block] = []
-        self.attacker_chain: List[Block] = []
+        # Blockchain states - fixed-size slot arrays sized in initialize_genesis();
+        # only the first public_len / attacker_len entries are part of each chain
+        self.public_chain: List[Optional[Block]] = []
+        self.attacker_chain: List[Optional[Block]] = []
+        self.public_len = 0
+        self.attacker_len = 0
+        # Length of the prefix both chains share; they only diverge past it
+        self.fork_point = 0
         
         # Statistics
         self.attacker_blocks_mined = 0
         self.honest_blocks_mined = 0
+        # Attacker blocks only enter the public chain through a reorg, so the
+        # running total below always equals the attacker's share of it
         self.attacker_blocks_in_main_chain = 0
         self.honest_blocks_in_main_chain = 0
         self.reorgs = 0
         
+        # Buffered per-round output, see _log()
+        self._log_buf = io.StringIO()
+        
     def initialize_genesis(self):
         """Create genesis block"""
         genesis = Block(
             height=0,
-            hash="genesis_hash",
-            prev_hash="0" * 64,
+            hash=hashlib.sha256(b"genesis").digest(),
+            prev_hash=bytes(32),
             timestamp=1763452800,
             difficulty=16,
             nonce=0xDEADBEEF,
             transactions=[],
             miner="GENESIS"
         )
-        self.public_chain = [genesis]
-        self.attacker_chain = [genesis]
+        # Neither chain can outgrow genesis plus every simulated block
+        capacity = self.config.total_blocks + 1
+        self.public_chain = [genesis] + [None] * (capacity - 1)
+        self.attacker_chain = [genesis] + [None] * (capacity - 1)
+        self.public_len = 1
+        self.attacker_len = 1
+        self.fork_point = 1
         
     def run_simulation(self):
         """Execute selfish mining simulation"""
-        print(f"\n{'='*70}")
-        print(f"SELFISH MINING SIMULATION")
-        print(f"{'='*70}")
-        print(f"Attacker Hashrate: {self.config.attacker_hashrate*100:.1f}%")
-        print(f"Honest Hashrate:   {self.config.honest_hashrate*100:.1f}%")
-        print(f"Total Blocks:      {self.config.total_blocks}")
-        print(f"{'='*70}\n")
+        print(f"\n{SEPARATOR}", file=self.out)
+        print(f"SELFISH MINING SIMULATION", file=self.out)
+        print(SEPARATOR, file=self.out)
+        print(f"Attacker Hashrate: {self.config.attacker_hashrate*100:.1f}%", file=self.out)
+        print(f"Honest Hashrate:   {self.config.honest_hashrate*100:.1f}%", file=self.out)
+        print(f"Total Blocks:      {self.config.total_blocks}", file=self.out)
+        print(f"{SEPARATOR}\n", file=self.out)
         
         self.initialize_genesis()
         
-        for round in range(1, self.config.total_blocks + 1):
-            # Determine who mines the next block
-            random_value = random.random()
-            
-            if random_value < self.config.attacker_hashrate:
+        # Determine who mines each block up front in a single batch of draws;
+        # the threshold and RNG are bound locally so no draw re-resolves them
+        threshold = self.config.attacker_hashrate
+        draw = self.rng.random
+        attacker_rounds = [draw() < threshold for _ in range(self.config.total_blocks)]
+        # ...and which of the (equal-hashrate) honest miners finds each honest block
+        next_honest_winner = iter(self.rng.choices(
+            self.honest_miners, k=attacker_rounds.count(False)
+        )).__next__
+        
+        # Hoist everything the round loop touches into locals
+        attacker_mines_block = self._attacker_mines_block
+        honest_miner_mines_block = self._honest_miner_mines_block
+        verbose = self.config.verbose
+        # In realtime mode rounds are paced by sleeps, so write each one out
+        # as it happens rather than holding it back in the buffer
+        realtime = self.config.realtime
+        flush_rounds = 1 if realtime else self.LOG_FLUSH_ROUNDS
+        
+        for round, attacker_wins in enumerate(attacker_rounds, start=1):
+            if attacker_wins:
                 # Attacker mines a block
-                self._attacker_mines_block()
+                attacker_mines_block()
             else:
                 # Honest miner mines a block
-                self._honest_miner_mines_block()
+                honest_miner_mines_block(next_honest_winner())
             
-            if self.config.verbose and round % 10 == 0:
+            if verbose and round % 10 == 0:
                 self._print_progress(round)
+            
+            if round % flush_rounds == 0:
+                self._flush_log()
+                if realtime:
+                    self.out.flush()
         
+        self._flush_log()
         self._print_results()
         
     def _attacker_mines_block(self):
         """Attacker finds a block - withhold it"""
-        tip = self.attacker_chain[-1]
+        # Heights equal chain indices, so the next height is the chain length
+        tip = self.attacker_chain[self.attacker_len - 1]
         new_block = self.attacker_miner.mine_block(
-            height=tip.height + 1,
+            height=self.attacker_len,
             prev_hash=tip.hash,
             difficulty=16
         )
-        self.attacker_chain.append(new_block)
+        self.attacker_chain[self.attacker_len] = new_block
+        self.attacker_len += 1
         self.attacker_blocks_mined += 1
         
         if self.config.verbose:
-            print(f"[ATTACKER] Mined block {new_block.height} - WITHHOLDING (private chain: {len(self.attacker_chain)})")
+            self._log(f"[ATTACKER] Mined block {new_block.height} - WITHHOLDING (private chain: {self.attacker_len})")
         
-    def _honest_miner_mines_block(self):
+    def _honest_miner_mines_block(self, miner: MiningSimulator):
         """Honest miner finds a block - broadcast immediately"""
-        miner = random.choice(self.honest_miners)
-        tip = self.public_chain[-1]
+        tip = self.public_chain[self.public_len - 1]
         new_block = miner.mine_block(
-            height=tip.height + 1,
+            height=self.public_len,
             prev_hash=tip.hash,
             difficulty=16
         )
-        self.public_chain.append(new_block)
+        self.public_chain[self.public_len] = new_block
+        self.public_len += 1
         self.honest_blocks_mined += 1
         
         if self.config.verbose:
-            print(f"[{miner.miner_id}] Mined block {new_block.height} - BROADCASTING (public chain: {len(self.public_chain)})")
+            self._log(f"[{miner.miner_id}] Mined block {new_block.height} - BROADCASTING (public chain: {self.public_len})")
         
         # Attacker's strategy: If public chain catches up, release private chain
-        if len(self.public_chain) >= len(self.attacker_chain):
+        if self.public_len >= self.attacker_len:
             self._attacker_releases_chain()
         
     def _attacker_releases_chain(self):
         """Attacker releases withheld blocks when public chain catches up"""
-        if len(self.attacker_chain) > len(self.public_chain):
+        if self.attacker_len > self.public_len:
             # Attacker's chain is longer - replace public chain
-            blocks_replaced = len(self.public_chain) - self._find_fork_point()
+            fork_point = self._find_fork_point()
+            blocks_replaced = self.public_len - fork_point
             self.reorgs += 1
             
-            print(f"\n{'!'*70}")
-            print(f"[ATTACKER] RELEASING {len(self.attacker_chain)} blocks - REORG of {blocks_replaced} blocks!")
-            print(f"{'!'*70}\n")
+            self._log(f"\n{REORG_BANNER}")
+            self._log(f"[ATTACKER] RELEASING {self.attacker_len} blocks - REORG of {blocks_replaced} blocks!")
+            self._log(f"{REORG_BANNER}\n")
             
             # Count attacker's blocks in new main chain
-            fork_point = self._find_fork_point()
-            attacker_blocks_won = len(self.attacker_chain) - fork_point
+            attacker_blocks_won = self.attacker_len - fork_point
             self.attacker_blocks_in_main_chain += attacker_blocks_won
             
-            # Replace public chain
-            self.public_chain = self.attacker_chain.copy()
+            # Replace public chain - only the blocks past the fork differ, so
+            # the shared prefix is kept and just the tail is swapped in
+            self.public_chain[fork_point:self.attacker_len] = self.attacker_chain[fork_point:self.attacker_len]
+            self.public_len = self.attacker_len
+            self.fork_point = self.public_len
         else:
             # Public chain won - attacker abandons private chain
             if self.config.verbose:
-                print(f"[ATTACKER] Private chain ABANDONED (public chain won)")
+                self._log(f"[ATTACKER] Private chain ABANDONED (public chain won)")
             
             # Count honest blocks
-            honest_blocks_won = len(self.public_chain) - len([b for b in self.public_chain if b.miner == "ATTACKER"])
+            honest_blocks_won = self.public_len - self.attacker_blocks_in_main_chain
             self.honest_blocks_in_main_chain = honest_blocks_won
             
-            # Attacker restarts from public chain
-            self.attacker_chain = self.public_chain.copy()
+            # Attacker restarts from public chain, discarding its private tail
+            fork_point = self._find_fork_point()
+            self.attacker_chain[fork_point:self.public_len] = self.public_chain[fork_point:self.public_len]
+            self.attacker_len = self.public_len
+            self.fork_point = self.attacker_len
     
     def _find_fork_point(self) -> int:
-        """Find where public and attacker chains diverged"""
-        for i in range(min(len(self.public_chain), len(self.attacker_chain))):
-            if self.public_chain[i].hash != self.attacker_chain[i].hash:
-                return i
-        return min(len(self.public_chain), len(self.attacker_chain))
+        """
+        Find where public and attacker chains diverged
+        Both chains are identical after every reorg or abandon, and from then
+        on each only grows by appending, so the divergence point is tracked
+        when they are synchronized instead of scanning for it.
+        """
+        return self.fork_point
+    
+    def _log(self, message: str):
+        """Queue a per-round message; written out by _flush_log()"""
+        self._log_buf.write(message)
+        self._log_buf.write("\n")
+        
+    def _flush_log(self):
+        """Write queued per-round messages to the output stream in a single call"""
+        self.out.write(self._log_buf.getvalue())
+        self._log_buf.seek(0)
+        self._log_buf.truncate()
     
     def _print_progress(self, round: int):
         """Print simulation progress"""
-        print(f"\n--- Round {round} ---")
-        print(f"Public chain:  {len(self.public_chain)} blocks")
-        print(f"Attacker chain: {len(self.attacker_chain)} blocks")
-        print(f"Reorganizations: {self.reorgs}")
+        self._log(f"\n--- Round {round} ---")
+        self._log(f"Public chain:  {self.public_len} blocks")
+        self._log(f"Attacker chain: {self.attacker_len} blocks")
+        self._log(f"Reorganizations: {self.reorgs}")
         
     def _print_results(self):
         """Print final simulation results"""
-        print(f"\n{'='*70}")
-        print(f"SIMULATION RESULTS")
-        print(f"{'='*70}")
+        print(f"\n{SEPARATOR}", file=self.out)
+        print(f"SIMULATION RESULTS", file=self.out)
+        print(SEPARATOR, file=self.out)
         
-        print(f"\nBlocks Mined:")
-        print(f"  Attacker: {self.attacker_blocks_mined}")
-        print(f"  Honest:   {self.honest_blocks_mined}")
-        print(f"  Total:    {self.attacker_blocks_mined + self.honest_blocks_mined}")
+        print(f"\nBlocks Mined:", file=self.out)
+        print(f"  Attacker: {self.attacker_blocks_mined}", file=self.out)
+        print(f"  Honest:   {self.honest_blocks_mined}", file=self.out)
+        print(f"  Total:    {self.attacker_blocks_mined + self.honest_blocks_mined}", file=self.out)
         
         # Calculate rewards
         expected_attacker_reward = self.config.attacker_hashrate * self.config.total_blocks
-        actual_attacker_reward = len([b for b in self.public_chain if b.miner == "ATTACKER"])
+        actual_attacker_reward = self.attacker_blocks_in_main_chain
         
-        print(f"\nBlocks in Main Chain (Rewards):")
-        print(f"  Attacker: {actual_attacker_reward} (expected {expected_attacker_reward:.1f})")
-        print(f"  Honest:   {len(self.public_chain) - actual_attacker_reward}")
+        print(f"\nBlocks in Main Chain (Rewards):", file=self.out)
+        print(f"  Attacker: {actual_attacker_reward} (expected {expected_attacker_reward:.1f})", file=self.out)
+        print(f"  Honest:   {self.public_len - actual_attacker_reward}", file=self.out)
         
-        print(f"\nReorganizations: {self.reorgs}")
+        print(f"\nReorganizations: {self.reorgs}", file=self.out)
         
         # Calculate profitability
         honest_reward = expected_attacker_reward
         selfish_reward = actual_attacker_reward
         profit = selfish_reward - honest_reward
         
-        print(f"\nProfitability Analysis:")
-        print(f"  Honest mining reward:  {honest_reward:.1f} blocks")
-        print(f"  Selfish mining reward: {selfish_reward:.1f} blocks")
-        print(f"  Profit/Loss:           {profit:+.1f} blocks ({(profit/honest_reward*100):+.1f}%)")
+        print(f"\nProfitability Analysis:", file=self.out)
+        print(f"  Honest mining reward:  {honest_reward:.1f} blocks", file=self.out)
+        print(f"  Selfish mining reward: {selfish_reward:.1f} blocks", file=self.out)
+        print(f"  Profit/Loss:           {profit:+.1f} blocks ({(profit/honest_reward*100):+.1f}%)", file=self.out)
         
         if profit > 0:
-            print(f"\n  ⚠️  SELFISH MINING IS PROFITABLE!")
+            print(f"\n  ⚠️  SELFISH MINING IS PROFITABLE!", file=self.out)
         else:
-            print(f"\n  ✓ Selfish mining is NOT profitable (as expected)")
+            print(f"\n  ✓ Selfish mining is NOT profitable (as expected)", file=self.out)
         
-        print(f"\n{'='*70}\n")
+        print(f"\n{SEPARATOR}\n", file=self.out)
 
 
 class DoubleSpendAttack:
     """Simulates double-spend attack using chain reorganization"""
     
-    def __init__(self, config: SimulationConfig):
+    def __init__(self, config: SimulationConfig, out: Optional[TextIO] = None):
         self.config = config
+        self.out = out if out is not None else sys.stdout
         
     async def run_simulation(self):
         """Execute double-spend attack"""
-        print(f"\n{'='*70}")
-        print(f"DOUBLE-SPEND ATTACK SIMULATION")
-        print(f"{'='*70}\n")
+        print(f"\n{SEPARATOR}", file=self.out)
+        print(f"DOUBLE-SPEND ATTACK SIMULATION", file=self.out)
+        print(f"{SEPARATOR}\n", file=self.out)
         
         # Step 1: Send transaction to victim (merchant)
-        print("[1] Attacker sends 10,000 SYL to merchant")
+        print("[1] Attacker sends 10,000 SYL to merchant", file=self.out)
         tx_to_merchant = {
             "from": "attacker_address",
             "to": "merchant_address",
             "amount": 10000,
             "nonce": 42
         }
-        print(f"    Transaction hash: {self._hash_tx(tx_to_merchant)}")
+        print(f"    Transaction hash: {self._hash_tx(tx_to_merchant)}", file=self.out)
         
         # Step 2: Wait for confirmations
         confirmations = 3
-        print(f"[2] Waiting for {confirmations} confirmations...")
+        print(f"[2] Waiting for {confirmations} confirmations...", file=self.out)
         for i in range(1, confirmations + 1):
             await asyncio.sleep(0.5)
-            print(f"    Confirmation {i}/{confirmations} - Block height: {100 + i}")
+            print(f"    Confirmation {i}/{confirmations} - Block height: {100 + i}", file=self.out)
         
-        print(f"[3] Merchant ships goods (off-chain)")
+        print(f"[3] Merchant ships goods (off-chain)", file=self.out)
         
         # Step 3: Attacker mines alternative chain with conflicting transaction
-        print(f"\n[4] Attacker secretly mines alternative chain...")
-        print(f"    Creating conflicting transaction (attacker -> self)")
+        print(f"\n[4] Attacker secretly mines alternative chain...", file=self.out)
+        print(f"    Creating conflicting transaction (attacker -> self)", file=self.out)
         
         tx_to_self = {
             "from": "attacker_address",
@@ -302,61 +393,63 @@ class DoubleSpendAttack:
             "amount": 10000,
             "nonce": 42  # Same nonce = double-spend
         }
-        print(f"    Conflicting tx hash: {self._hash_tx(tx_to_self)}")
+        print(f"    Conflicting tx hash: {self._hash_tx(tx_to_self)}", file=self.out)
         
         # Step 4: Attacker releases longer chain
         blocks_to_mine = confirmations + 3
-        print(f"\n[5] Attacker mines {blocks_to_mine} blocks in secret...")
+        print(f"\n[5] Attacker mines {blocks_to_mine} blocks in secret...", file=self.out)
         await asyncio.sleep(1.5)
         
-        print(f"[6] Attacker broadcasts longer chain to network")
-        print(f"    Original chain height: {100 + confirmations}")
-        print(f"    Attacker chain height: {100 + blocks_to_mine}")
+        print(f"[6] Attacker broadcasts longer chain to network", file=self.out)
+        print(f"    Original chain height: {100 + confirmations}", file=self.out)
+        print(f"    Attacker chain height: {100 + blocks_to_mine}", file=self.out)
         
         # Step 5: Network accepts longer chain (reorg happens)
-        print(f"\n[7] Network reorganization occurring...")
-        print(f"    Reorganization depth: {confirmations} blocks")
-        print(f"    Transaction to merchant: REVERSED ❌")
-        print(f"    Transaction to self:     CONFIRMED ✅")
-        
-        print(f"\n[8] ATTACK SUCCESSFUL!")
-        print(f"    - Merchant shipped goods but didn't receive payment")
-        print(f"    - Attacker keeps 10,000 SYL in different address")
-        print(f"    - Total attacker profit: 10,000 SYL + goods received")
-        
-        print(f"\n{'='*70}")
-        print(f"MITIGATION:")
-        print(f"  - Merchants should wait for 6+ confirmations (1 hour)")
-        print(f"  - MAX_REORG_DEPTH prevents deep reorganizations")
-        print(f"  - Monitor for unusual reorganization activity")
-        print(f"{'='*70}\n")
+        print(f"\n[7] Network reorganization occurring...", file=self.out)
+        print(f"    Reorganization depth: {confirmations} blocks", file=self.out)
+        print(f"    Transaction to merchant: REVERSED ❌", file=self.out)
+        print(f"    Transaction to self:     CONFIRMED ✅", file=self.out)
+        
+        print(f"\n[8] ATTACK SUCCESSFUL!", file=self.out)
+        print(f"    - Merchant shipped goods but didn't receive payment", file=self.out)
+        print(f"    - Attacker keeps 10,000 SYL in different address", file=self.out)
+        print(f"    - Total attacker profit: 10,000 SYL + goods received", file=self.out)
+        
+        print(f"\n{SEPARATOR}", file=self.out)
+        print(f"MITIGATION:", file=self.out)
+        print(f"  - Merchants should wait for 6+ confirmations (1 hour)", file=self.out)
+        print(f"  - MAX_REORG_DEPTH prevents deep reorganizations", file=self.out)
+        print(f"  - Monitor for unusual reorganization activity", file=self.out)
+        print(f"{SEPARATOR}\n", file=self.out)
     
     def _hash_tx(self, tx: dict) -> str:
         """Calculate transaction hash"""
-        tx_str = json.dumps(tx, sort_keys=True)
-        return hashlib.sha256(tx_str.encode()).hexdigest()[:16]
+        # Fields are joined in a fixed order, which keeps the hash deterministic
+        tx_bytes = f"{tx['from']}|{tx['to']}|{tx['amount']}|{tx['nonce']}".encode()
+        return hashlib.sha256(tx_bytes).hexdigest()[:16]
 
 
 class LongRangeAttack:
     """Simulates long-range attack (rewrite history from genesis)"""
     
-    def __init__(self, config: SimulationConfig):
+    def __init__(self, config: SimulationConfig, out: Optional[TextIO] = None):
         self.config = config
+        self.out = out if out is not None else sys.stdout
         
     async def run_simulation(self):
         """Execute long-range attack"""
-        print(f"\n{'='*70}")
-        print(f"LONG-RANGE ATTACK SIMULATION")
-        print(f"{'='*70}\n")
+        print(f"\n{SEPARATOR}", file=self.out)
+        print(f"LONG-RANGE ATTACK SIMULATION", file=self.out)
+        print(f"{SEPARATOR}\n", file=self.out)
         
         current_height = 10000
         attack_fork_point = 1000
         
-        print(f"[1] Current blockchain height: {current_height}")
-        print(f"[2] Attacker attempts to fork from block {attack_fork_point}")
-        print(f"    (rewrites {current_height - attack_fork_point} blocks of history)")
+        print(f"[1] Current blockchain height: {current_height}", file=self.out)
+        print(f"[2] Attacker attempts to fork from block {attack_fork_point}", file=self.out)
+        print(f"    (rewrites {current_height - attack_fork_point} blocks of history)", file=self.out)
         
-        print(f"\n[3] Attacker starts mining alternative chain...")
+        print(f"\n[3] Attacker starts mining alternative chain...", file=self.out)
         
         # Calculate if attacker can catch up
         blocks_to_mine = current_height - attack_fork_point
@@ -368,64 +461,78 @@ class LongRangeAttack:
         # Time for honest network to extend during that time
         honest_blocks_during = honest_rate * attacker_time
         
-        print(f"\n[4] Attack feasibility analysis:")
-        print(f"    Blocks to rewrite: {blocks_to_mine}")
-        print(f"    Attacker time:     {attacker_time:.1f} rounds")
-        print(f"    Honest blocks during attack: {honest_blocks_during:.1f}")
-        print(f"    Final attacker chain: {current_height - attack_fork_point:.0f}")
-        print(f"    Final honest chain:   {current_height + honest_blocks_during:.0f}")
+        print(f"\n[4] Attack feasibility analysis:", file=self.out)
+        print(f"    Blocks to rewrite: {blocks_to_mine}", file=self.out)
+        print(f"    Attacker time:     {attacker_time:.1f} rounds", file=self.out)
+        print(f"    Honest blocks during attack: {honest_blocks_during:.1f}", file=self.out)
+        print(f"    Final attacker chain: {current_height - attack_fork_point:.0f}", file=self.out)
+        print(f"    Final honest chain:   {current_height + honest_blocks_during:.0f}", file=self.out)
+        
+        # Same closed-form analysis across a range of attacker hashrates
+        print(f"\n    Feasibility by attacker hashrate:", file=self.out)
+        rows = [f"    {'Hashrate':>8}  {'Attacker time':>13}  {'Honest blocks':>13}  {'Final honest':>12}"]
+        for percent in range(10, 51, 5):
+            rate = percent / 100
+            sweep_time = blocks_to_mine / rate
+            sweep_honest = (1 - rate) * sweep_time
+            rows.append(
+                f"    {percent:>7}%  {sweep_time:>13.1f}  {sweep_honest:>13.1f}  "
+                f"{current_height + sweep_honest:>12.0f}"
+            )
+        print("\n".join(rows), file=self.out)
         
         if current_height - attack_fork_point > current_height + honest_blocks_during:
-            print(f"\n[5] ❌ ATTACK FAILED!")
-            print(f"    Attacker chain would be shorter than honest chain")
+            print(f"\n[5] ❌ ATTACK FAILED!", file=self.out)
+            print(f"    Attacker chain would be shorter than honest chain", file=self.out)
         else:
-            print(f"\n[5] ⚠️  ATTACK THEORETICALLY POSSIBLE!")
-            print(f"    But...")
+            print(f"\n[5] ⚠️  ATTACK THEORETICALLY POSSIBLE!", file=self.out)
+            print(f"    But...", file=self.out)
         
         # Check MAX_REORG_DEPTH defense
         max_reorg_depth = 100
         reorg_depth = current_height - attack_fork_point
         
-        print(f"\n[6] MAX_REORG_DEPTH Defense Check:")
-        print(f"    MAX_REORG_DEPTH: {max_reorg_depth} blocks")
-        print(f"    Attack reorg depth: {reorg_depth} blocks")
+        print(f"\n[6] MAX_REORG_DEPTH Defense Check:", file=self.out)
+        print(f"    MAX_REORG_DEPTH: {max_reorg_depth} blocks", file=self.out)
+        print(f"    Attack reorg depth: {reorg_depth} blocks", file=self.out)
         
         if reorg_depth > max_reorg_depth:
-            print(f"\n[7] ✓ ATTACK BLOCKED BY MAX_REORG_DEPTH!")
-            print(f"    Honest nodes reject reorganization beyond {max_reorg_depth} blocks")
-            print(f"    Attacker's alternative chain is rejected")
+            print(f"\n[7] ✓ ATTACK BLOCKED BY MAX_REORG_DEPTH!", file=self.out)
+            print(f"    Honest nodes reject reorganization beyond {max_reorg_depth} blocks", file=self.out)
+            print(f"    Attacker's alternative chain is rejected", file=self.out)
         else:
-            print(f"\n[7] ⚠️  Attack within reorg limit - additional analysis needed")
-        
-        print(f"\n{'='*70}")
-        print(f"MITIGATION:")
-        print(f"  - MAX_REORG_DEPTH = {max_reorg_depth} blocks (enforced)")
-        print(f"  - Checkpoints at every 10,000 blocks")
-        print(f"  - Social consensus for resolving deep forks")
-        print(f"{'='*70}\n")
+            print(f"\n[7] ⚠️  Attack within reorg limit - additional analysis needed", file=self.out)
+        
+        print(f"\n{SEPARATOR}", file=self.out)
+        print(f"MITIGATION:", file=self.out)
+        print(f"  - MAX_REORG_DEPTH = {max_reorg_depth} blocks (enforced)", file=self.out)
+        print(f"  - Checkpoints at every 10,000 blocks", file=self.out)
+        print(f"  - Social consensus for resolving deep forks", file=self.out)
+        print(f"{SEPARATOR}\n", file=self.out)
 
 
 class TimestampManipulationAttack:
     """Simulates timestamp manipulation to lower difficulty"""
     
-    def __init__(self, config: SimulationConfig):
+    def __init__(self, config: SimulationConfig, out: Optional[TextIO] = None):
         self.config = config
+        self.out = out if out is not None else sys.stdout
         
     async def run_simulation(self):
         """Execute timestamp manipulation attack"""
-        print(f"\n{'='*70}")
-        print(f"TIMESTAMP MANIPULATION ATTACK (Timewarp)")
-        print(f"{'='*70}\n")
+        print(f"\n{SEPARATOR}", file=self.out)
+        print(f"TIMESTAMP MANIPULATION ATTACK (Timewarp)", file=self.out)
+        print(f"{SEPARATOR}\n", file=self.out)
         
         max_future_drift = 60  # seconds
         target_block_time = 600  # 10 minutes
         difficulty_adjust_interval = 100  # blocks
         
-        print(f"[1] Attack strategy: Set timestamps far in future")
-        print(f"    Goal: Make difficulty adjustment think blocks are fast")
-        print(f"    Result: Difficulty decreases artificially")
+        print(f"[1] Attack strategy: Set timestamps far in future", file=self.out)
+        print(f"    Goal: Make difficulty adjustment think blocks are fast", file=self.out)
+        print(f"    Result: Difficulty decreases artificially", file=self.out)
         
-        print(f"\n[2] Mining {difficulty_adjust_interval} blocks with manipulated timestamps...")
+        print(f"\n[2] Mining {difficulty_adjust_interval} blocks with manipulated timestamps...", file=self.out)
         
         current_time = int(time.time())
         manipulated_blocks = []
@@ -442,50 +549,63 @@ class TimestampManipulationAttack:
         actual_time = last_block_time - first_block_time
         expected_time = difficulty_adjust_interval * target_block_time
         
-        print(f"\n[3] Difficulty adjustment calculation:")
-        print(f"    Expected time: {expected_time} seconds ({expected_time/3600:.1f} hours)")
-        print(f"    Actual time:   {actual_time} seconds ({actual_time/3600:.1f} hours)")
-        print(f"    Ratio:         {actual_time/expected_time:.2f}")
+        print(f"\n[3] Difficulty adjustment calculation:", file=self.out)
+        print(f"    Expected time: {expected_time} seconds ({expected_time/3600:.1f} hours)", file=self.out)
+        print(f"    Actual time:   {actual_time} seconds ({actual_time/3600:.1f} hours)", file=self.out)
+        print(f"    Ratio:         {actual_time/expected_time:.2f}", file=self.out)
         
         # But wait - Median-Time-Past (MTP) defense
-        print(f"\n[4] Median-Time-Past (MTP) Defense:")
-        print(f"    MTP window: 11 blocks")
-        print(f"    New block timestamp must be > MTP")
+        print(f"\n[4] Median-Time-Past (MTP) Defense:", file=self.out)
+        print(f"    MTP window: 11 blocks", file=self.out)
+        print(f"    New block timestamp must be > MTP", file=self.out)
         
         # With MTP, attacker can't set all timestamps to max future drift
         # because each block's timestamp must be > median of last 11
         
-        print(f"\n[5] Attack with MTP defense:")
-        mtp_protected_blocks = []
-        for i in range(difficulty_adjust_interval):
-            if i < 11:
-                # First 11 blocks can be set to current_time + max_future_drift
-                timestamp = current_time + max_future_drift - 1
-            else:
-                # Must be > median of last 11 blocks
-                last_11 = mtp_protected_blocks[-11:]
-                median = sorted(last_11)[5]  # Middle of 11 values
-                timestamp = median + 1  # Minimum valid timestamp
+        print(f"\n[5] Attack with MTP defense:", file=self.out)
+        # First 11 blocks can be set to current_time + max_future_drift
+        mtp_protected_blocks = [current_time + max_future_drift - 1] * 11
+        # Last 11 timestamps, kept sorted as the window slides
+        mtp_window = sorted(mtp_protected_blocks)
+        for i in range(11, difficulty_adjust_interval):
+            # Must be > median of last 11 blocks
+            median = mtp_window[5]  # Middle of 11 values
+            timestamp = median + 1  # Minimum valid timestamp
             
+            del mtp_window[bisect.bisect_left(mtp_window, mtp_protected_blocks[i - 11])]
+            bisect.insort(mtp_window, timestamp)
             mtp_protected_blocks.append(timestamp)
         
         protected_actual_time = mtp_protected_blocks[-1] - mtp_protected_blocks[0]
         
-        print(f"    With MTP: {protected_actual_time} seconds")
-        print(f"    Ratio:    {protected_actual_time/expected_time:.2f}")
+        print(f"    With MTP: {protected_actual_time} seconds", file=self.out)
+        print(f"    Ratio:    {protected_actual_time/expected_time:.2f}", file=self.out)
         
         if protected_actual_time < expected_time * 0.75:  # More than 25% decrease
-            print(f"\n[6] ⚠️  Attack partially successful (difficulty would decrease)")
+            print(f"\n[6] ⚠️  Attack partially successful (difficulty would decrease)", file=self.out)
         else:
-            print(f"\n[6] ✓ Attack mostly mitigated by MTP")
-        
-        print(f"\n{'='*70}")
-        print(f"MITIGATION:")
-        print(f"  - Median-Time-Past (MTP) with 11-block window ✓")
-        print(f"  - MAX_FUTURE_DRIFT = {max_future_drift} seconds ✓")
-        print(f"  - Difficulty adjustment clamped to ±25% ✓")
-        print(f"  - Result: Timewarp attack largely prevented")
-        print(f"{'='*70}\n")
+            print(f"\n[6] ✓ Attack mostly mitigated by MTP", file=self.out)
+        
+        print(f"\n{SEPARATOR}", file=self.out)
+        print(f"MITIGATION:", file=self.out)
+        print(f"  - Median-Time-Past (MTP) with 11-block window ✓", file=self.out)
+        print(f"  - MAX_FUTURE_DRIFT = {max_future_drift} seconds ✓", file=self.out)
+        print(f"  - Difficulty adjustment clamped to ±25% ✓", file=self.out)
+        print(f"  - Result: Timewarp attack largely prevented", file=self.out)
+        print(f"{SEPARATOR}\n", file=self.out)
+
+
+def run_selfish_mining(config: SimulationConfig) -> str:
+    """Run the selfish mining simulation and return its report (worker process entry point)"""
+    out = io.StringIO()
+    SelfishMiningAttack(config, out).run_simulation()
+    return out.getvalue()
+
+
+async def collect_report(simulator) -> str:
+    """Run an async simulation writing to an in-memory stream and return its report"""
+    await simulator.run_simulation()
+    return simulator.out.getvalue()
 
 
 async def main():
@@ -499,6 +619,12 @@ async def main():
                        help="Total blocks to simulate")
     parser.add_argument("--verbose", action="store_true",
                        help="Verbose output")
+    parser.add_argument("--seed", type=int, default=None,
+                       help="Random seed for reproducible simulations")
+    parser.add_argument("--realtime", action="store_true",
+                       help="Sleep for simulated mining time (capped at 100ms per block); "
+                            "with --attack all the selfish mining report is printed only "
+                            "once its worker process finishes")
     
     args = parser.parse_args()
     
@@ -508,33 +634,50 @@ async def main():
         total_blocks=args.blocks,
         attack_type=args.attack,
         network_delay=0.5,
-        verbose=args.verbose
+        verbose=args.verbose,
+        seed=args.seed,
+        realtime=args.realtime
     )
     
-    print(f"\n{'#'*70}")
+    print(f"\n{SUITE_BANNER}")
     print(f"# OpenSyria Digital Lira - 51% Attack Simulation Suite")
     print(f"# Test Date: {time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime())}")
-    print(f"{'#'*70}\n")
+    print(f"{SUITE_BANNER}\n")
+    
+    if args.attack == "all":
+        # The simulations share no state: run the CPU-bound selfish mining one
+        # in a worker process while the async ones wait concurrently. Each
+        # writes to its own buffer so the reports still print in order.
+        loop = asyncio.get_running_loop()
+        sys.stdout.flush()  # Don't hand pending header output to the worker
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            reports = await asyncio.gather(
+                loop.run_in_executor(pool, run_selfish_mining, config),
+                collect_report(DoubleSpendAttack(config, io.StringIO())),
+                collect_report(LongRangeAttack(config, io.StringIO())),
+                collect_report(TimestampManipulationAttack(config, io.StringIO())),
+            )
+        sys.stdout.write("".join(reports))
     
-    if args.attack in ["selfish", "all"]:
+    elif args.attack == "selfish":
         simulator = SelfishMiningAttack(config)
         simulator.run_simulation()
     
-    if args.attack in ["doublespend", "all"]:
+    elif args.attack == "doublespend":
         simulator = DoubleSpendAttack(config)
         await simulator.run_simulation()
     
-    if args.attack in ["longrange", "all"]:
+    elif args.attack == "longrange":
         simulator = LongRangeAttack(config)
         await simulator.run_simulation()
     
-    if args.attack in ["timewarp", "all"]:
+    elif args.attack == "timewarp":
         simulator = TimestampManipulationAttack(config)
         await simulator.run_simulation()
     
-    print(f"\n{'#'*70}")
+    print(f"\n{SUITE_BANNER}")
     print(f"# Simulation Complete")
-    print(f"{'#'*70}\n")
+    print(f"{SUITE_BANNER}\n")
 
 
 if __name__ == "__main__":